@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 from typing import Annotated
 
@@ -27,8 +28,14 @@ async def login_access_token(
     logger.info(f"Login attempt for email: {form_data.username}")
     
     user = await UserRepository.get_by_email(db, email=form_data.username)
+    
+    # Password verification is deliberately CPU-heavy; run it in a worker
+    # thread so concurrent requests are not blocked on the event loop
+    password_ok = user is not None and await asyncio.to_thread(
+        security.verify_password, form_data.password, user.hashed_password
+    )
 
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    if not password_ok:
         logger.warning(f"Failed login attempt for email: {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
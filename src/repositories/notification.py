@@ -1,9 +1,11 @@
 from typing import List, Optional
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import case, cast, false, insert, literal, select, func
 from sqlalchemy.orm import joinedload
 
-from src.models.notification import Notification
+from src.models.notification import Notification, NotificationType
+from src.models.task import Task, TaskStatus
 from src.core.constants import DEFAULT_PAGE_SIZE
 
 
@@ -115,59 +117,6 @@ class NotificationRepository:
         )
         return result.scalar_one()
     
-    @staticmethod
-    async def create(
-        db: AsyncSession,
-        user_id: int,
-        task_id: int,
-        notification_type: str,
-        message: str
-    ) -> Notification:
-        """
-        Create a new notification for a user about a task event.
-        
-        This method creates a notification in the database with is_read set to False,
-        commits it, and returns the fully loaded notification object.
-        
-        Args:
-            db: Async database session for executing queries
-            user_id: ID of the user who will receive this notification
-            task_id: ID of the task this notification is about
-            notification_type: Type of notification (e.g., "due_today", "overdue", "due_soon")
-            message: Human-readable notification message
-        
-        Returns:
-            Notification: Newly created notification object with:
-                - Auto-generated ID
-                - is_read set to False
-                - created_at timestamp auto-populated
-                - Task relationship eagerly loaded
-        
-        Note:
-            - Commits transaction immediately
-            - All new notifications are created as unread (is_read = False)
-            - Performs additional query to eager load task relationship
-            - Does not validate if user_id or task_id exist (foreign key constraints apply)
-        """
-        db_notification = Notification(
-            user_id=user_id,
-            task_id=task_id,
-            notification_type=notification_type,
-            message=message,
-            is_read=False
-        )
-        db.add(db_notification)
-        await db.commit()
-        await db.refresh(db_notification)
-        
-        # Load the task relationship
-        result = await db.scalars(
-            select(Notification)
-            .options(joinedload(Notification.task))
-            .where(Notification.id == db_notification.id)
-        )
-        return result.one()
-    
     @staticmethod
     async def mark_as_read(db: AsyncSession, notification: Notification) -> Notification:
         """
@@ -219,38 +168,86 @@ class NotificationRepository:
         await db.commit()
     
     @staticmethod
-    async def exists_for_task_and_type(
+    async def create_due_date_notifications(
         db: AsyncSession,
-        task_id: int,
-        notification_type: str
-    ) -> bool:
+        now: datetime,
+        today_end: datetime,
+        tomorrow_end: datetime
+    ) -> List[NotificationType]:
         """
-        Check if an unread notification of a specific type already exists for a task.
+        Create due-date notifications for every eligible task in a single statement.
         
-        This method prevents duplicate notifications by checking if an unread
-        notification of the same type already exists for the given task.
+        This method issues one INSERT ... SELECT ... WHERE NOT EXISTS that picks
+        unfinished tasks due before tomorrow_end, classifies each one, and inserts
+        a notification unless an unread one of the same type already exists for
+        that task. Selection, de-duplication and insertion happen in the same
+        statement, so one run never notifies the same task twice. Across
+        concurrent runs the de-duplication is best-effort (see Note).
+        
+        Classification:
+            - due_date < now: OVERDUE ("Task '<title>' is overdue")
+            - now <= due_date <= today_end: DUE_TODAY ("Task '<title>' is due today")
+            - today_end < due_date <= tomorrow_end: DUE_SOON ("Task '<title>' is due soon")
         
         Args:
             db: Async database session for executing queries
-            task_id: ID of the task to check
-            notification_type: Type of notification to check for (e.g., "overdue", "due_today")
+            now: Current instant (timezone-aware)
+            today_end: Last instant of the current day (timezone-aware)
+            tomorrow_end: Last instant of the following day (timezone-aware)
         
         Returns:
-            bool: True if at least one unread notification of this type exists for the task,
-                 False if no such notification exists or all are marked as read
+            List[NotificationType]: Type of each notification created, one entry per row.
+                                    Empty list if nothing was created.
         
         Note:
-            - Only checks unread notifications (is_read = False)
-            - Used to prevent duplicate notifications in scheduled jobs
-            - Performs efficient COUNT query (doesn't load notification objects)
-            - Returns False if count is 0, True if count > 0
-            - Read notifications are ignored (allows creating new notifications if user already read previous ones)
+            - Commits transaction immediately
+            - Notifications are sent to the task owner (owner_id)
+            - Tasks with status DONE or without a due_date are ignored
+            - A task is skipped only if it already has an unread notification of the
+              same type; read notifications do not count as duplicates
+            - There is no unique constraint behind the NOT EXISTS check. At READ
+              COMMITTED, two schedulers running this statement at the same time
+              do not see each other's uncommitted rows, so both can insert the
+              same notification
         """
-        result = await db.execute(
-            select(func.count(Notification.id))
-            .where(Notification.task_id == task_id)
-            .where(Notification.notification_type == notification_type)
+        enum_type = Notification.notification_type.type
+        
+        def _typed(notification_type: NotificationType):
+            # Explicit CAST so the database does not infer the value as plain text
+            return cast(literal(notification_type, enum_type), enum_type)
+        
+        bucket = case(
+            (Task.due_date < now, _typed(NotificationType.OVERDUE)),
+            (Task.due_date <= today_end, _typed(NotificationType.DUE_TODAY)),
+            else_=_typed(NotificationType.DUE_SOON)
+        )
+        message = literal("Task '") + Task.title + case(
+            (Task.due_date < now, literal("' is overdue")),
+            (Task.due_date <= today_end, literal("' is due today")),
+            else_=literal("' is due soon")
+        )
+        already_notified = (
+            select(Notification.id)
+            .where(Notification.task_id == Task.id)
+            .where(Notification.notification_type == bucket)
             .where(Notification.is_read == False)
+            .exists()
         )
-        count = result.scalar_one()
-        return count > 0
+        candidates = (
+            select(Task.owner_id, Task.id, bucket, message, false())
+            .where(Task.due_date.isnot(None))
+            .where(Task.due_date <= tomorrow_end)
+            .where(Task.status != TaskStatus.DONE)
+            .where(~already_notified)
+        )
+        result = await db.execute(
+            insert(Notification)
+            .from_select(
+                ["user_id", "task_id", "notification_type", "message", "is_read"],
+                candidates
+            )
+            .returning(Notification.notification_type)
+        )
+        created = list(result.scalars().all())
+        await db.commit()
+        return created
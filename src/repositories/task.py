@@ -1,9 +1,10 @@
 from typing import List, Optional
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
-from src.models.task import Task
+from src.models.task import Task, TaskStatus
 from src.schemas.task import TaskCreate, TaskUpdate
 from src.core.constants import DEFAULT_PAGE_SIZE
 
@@ -277,4 +278,35 @@ class TaskRepository:
         # Load the owner relationship
         await db.refresh(task, ["owner"])
         
-        return task
\ No newline at end of file
+        return task
+
+    @staticmethod
+    async def has_pending_due_before(db: AsyncSession, horizon: datetime) -> bool:
+        """
+        Check whether any unfinished task is due on or before a given instant.
+        
+        This method performs a single-row existence probe used to skip the
+        due-date notification insert entirely when no task could produce
+        a notification.
+        
+        Args:
+            db: Async database session for executing queries
+            horizon: Latest due date that is still of interest (timezone-aware)
+        
+        Returns:
+            bool: True if at least one task with status != DONE has a due_date
+                 on or before horizon, False otherwise
+        
+        Note:
+            - Tasks without a due_date are ignored
+            - Uses LIMIT 1, so the database stops at the first match
+            - Does not load any Task objects
+        """
+        result = await db.execute(
+            select(Task.id)
+            .where(Task.due_date.isnot(None))
+            .where(Task.due_date <= horizon)
+            .where(Task.status != TaskStatus.DONE)
+            .limit(1)
+        )
+        return result.first() is not None
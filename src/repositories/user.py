@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -112,14 +113,15 @@ class UserRepository:
                 - Timestamps (created_at, updated_at) auto-populated
         
         Note:
-            - Password is automatically hashed using bcrypt
+            - Password is automatically hashed (argon2), in a worker thread so
+              the event loop is not blocked while hashing
             - Plain text password is never stored in database
             - Email uniqueness must be validated before calling
             - Commits transaction immediately
         """
         db_user = User(
             email=user_in.email,
-            hashed_password=get_password_hash(user_in.password),
+            hashed_password=await asyncio.to_thread(get_password_hash, user_in.password),
             role=user_in.role,
             is_active=user_in.is_active
         )
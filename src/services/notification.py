@@ -2,13 +2,11 @@ from typing import List
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
 
-from src.models.notification import Notification, NotificationType
-from src.models.task import Task, TaskStatus
+from src.models.notification import Notification
 from src.models.user import User
 from src.repositories.notification import NotificationRepository
+from src.repositories.task import TaskRepository
 from src.core.permissions import require_notification_access
 from src.core.constants import DEFAULT_PAGE_SIZE
 from src.core.errors import ERROR_NOTIFICATION_NOT_FOUND
@@ -214,9 +212,13 @@ class NotificationService:
                 - "overdue" (int): Count of overdue notifications created
         
         Behavior:
-            - Only processes tasks with status != DONE
-            - Prevents duplicate notifications by checking if notification already exists
-            - Each task can have only one notification per type
+            - Only processes tasks with status != DONE that are due before the end of tomorrow
+            - Returns immediately (one existence query, no insert or commit) when
+              no such task exists
+            - Runs as a single INSERT ... SELECT statement regardless of the number of tasks
+            - Skips tasks that already have an unread notification of the same type
+            - De-duplication is best-effort: overlapping runs (e.g. two schedulers)
+              can both create the same notification
             - All timestamps are handled in UTC timezone
             - Notifications are sent to the task owner (owner_id)
         
@@ -224,7 +226,7 @@ class NotificationService:
             {"due_today": 3, "due_soon": 5, "overdue": 2}
         
         Note:
-            - This is an idempotent operation (safe to run multiple times)
+            - Safe to run repeatedly; sequential runs do not duplicate unread notifications
             - Recommended execution frequency: every 1-6 hours
             - Does not delete or update existing notifications
             - Task completion status changes won't remove existing notifications
@@ -239,65 +241,18 @@ class NotificationService:
             "overdue": 0
         }
         
-        # Get all tasks with due_date that are not completed
-        result = await db.scalars(
-            select(Task)
-            .options(joinedload(Task.owner))
-            .where(Task.due_date.isnot(None))
-            .where(Task.status != TaskStatus.DONE)
-        )
-        tasks = list(result.all())
+        # Fast path: nothing can be notified if no unfinished task is due
+        # before the end of tomorrow, so skip the insert and its commit
+        if not await TaskRepository.has_pending_due_before(db, tomorrow_end):
+            logger.debug(f"No pending tasks due before {tomorrow_end}, skipping notification insert")
+            return notifications_created
         
-        for task in tasks:
-
-            task_due_date = task.due_date
-            if task_due_date.tzinfo is None:
-                task_due_date = task_due_date.replace(tzinfo=timezone.utc)
-            
-            # Overdue task
-            if task_due_date < now:
-                # Check if an overdue notification already exists
-                exists = await NotificationRepository.exists_for_task_and_type(
-                    db, task.id, NotificationType.OVERDUE
-                )
-                if not exists:
-                    await NotificationRepository.create(
-                        db=db,
-                        user_id=task.owner_id,
-                        task_id=task.id,
-                        notification_type=NotificationType.OVERDUE,
-                        message=f"Task '{task.title}' is overdue"
-                    )
-                    notifications_created["overdue"] += 1
-            
-            # Task due today
-            elif now <= task_due_date <= today_end:
-                exists = await NotificationRepository.exists_for_task_and_type(
-                    db, task.id, NotificationType.DUE_TODAY
-                )
-                if not exists:
-                    await NotificationRepository.create(
-                        db=db,
-                        user_id=task.owner_id,
-                        task_id=task.id,
-                        notification_type=NotificationType.DUE_TODAY,
-                        message=f"Task '{task.title}' is due today"
-                    )
-                    notifications_created["due_today"] += 1
-            
-            # Task due in the next 24 hours
-            elif today_end < task_due_date <= tomorrow_end:
-                exists = await NotificationRepository.exists_for_task_and_type(
-                    db, task.id, NotificationType.DUE_SOON
-                )
-                if not exists:
-                    await NotificationRepository.create(
-                        db=db,
-                        user_id=task.owner_id,
-                        task_id=task.id,
-                        notification_type=NotificationType.DUE_SOON,
-                        message=f"Task '{task.title}' is due soon"
-                    )
-                    notifications_created["due_soon"] += 1
+        # One INSERT ... SELECT classifies eligible tasks and skips those that
+        # already have an unread notification of the same type
+        created_types = await NotificationRepository.create_due_date_notifications(
+            db, now=now, today_end=today_end, tomorrow_end=tomorrow_end
+        )
+        for notification_type in created_types:
+            notifications_created[notification_type.value] += 1
         
         return notifications_created
@@ -8,37 +8,105 @@ abstractions for database, authentication, and API client setup.
 Fixtures are scoped appropriately to balance test isolation and performance:
 - session: Created once per test session
 - function: Created for each test function (default, ensures isolation)
+
+All tests and async fixtures share one session-wide event loop (see
+asyncio_default_*_loop_scope in pyproject.toml), so the engine, app and
+HTTP client can be cached for the session independently of loop scope.
 """
+import os
 import pytest
-import asyncio
-from typing import AsyncGenerator, Generator
-from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from datetime import timedelta
+from typing import AsyncGenerator, Optional
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport, Headers
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+from passlib.context import CryptContext
 
 from src.main import app
 from src.db.base import Base
 from src.db.session import get_db
 from src.models.user import User, UserRole
+from src.models.task import Task
+from src.core import security
 from src.core.security import get_password_hash, create_access_token
 from tests.test_config import test_settings
+from tests.factories import TaskFactory
+
+
+# Session-scoped tokens must stay valid for the whole run, however long it
+# takes, rather than for the application's default expiry
+SESSION_TOKEN_TTL = timedelta(days=1)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    Use the cheapest argon2 parameters for the whole test session.
+    
+    Production cost settings make every user creation and login spend tens
+    of milliseconds hashing; tests only need hashes that verify. Verification
+    reads the parameters from the hash itself, so hashes made here still
+    check correctly. The original context is restored when the session ends.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(security, "pwd_context", CryptContext(
+            schemes=["argon2"],
+            argon2__rounds=1,
+            argon2__memory_cost=8,
+            argon2__parallelism=1,
+        ))
+        yield
 
 
 # ============================================================================
 # Database Fixtures
 # ============================================================================
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
+def _create_sqlite_engine(url: URL) -> AsyncEngine:
     """
-    Create an event loop for the test session.
+    Create an in-memory SQLite engine usable by the test fixtures.
     
-    This fixture ensures all async tests share the same event loop,
-    which is required for session-scoped async fixtures.
+    StaticPool keeps a single connection so every session sees the same
+    in-memory database. pysqlite's own transaction handling is disabled
+    and BEGIN is emitted explicitly, which is required for the SAVEPOINTs
+    used by db_session; foreign keys are switched on so ON DELETE CASCADE
+    behaves as on PostgreSQL.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    engine = create_async_engine(
+        url,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        echo=False,  # Set to True for SQL debugging
+    )
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    return engine
+
+
+def _worker_schema() -> Optional[str]:
+    """
+    Return the PostgreSQL schema reserved for this pytest-xdist worker.
+    
+    Under `pytest -n ...` every worker process gets its own schema (e.g.
+    "test_gw0") so parallel workers never see each other's tables. Returns
+    None when running without xdist, in which case the default schema is
+    used as before.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"test_{worker}" if worker else None
 
 
 @pytest.fixture(scope="session")
@@ -46,38 +114,61 @@ async def test_engine():
     """
     Create a test database engine for the entire test session.
     
-    Uses NullPool to avoid connection pool issues in testing.
     The engine is created once and reused across all tests for performance.
+    
+    The default TEST_DATABASE_URL ("sqlite+aiosqlite://") runs the suite
+    against an in-memory database. A PostgreSQL URL (asyncpg driver) uses a
+    small connection pool, so each test checks out an already-open
+    connection instead of reconnecting; this is safe because every test
+    and fixture runs on the same session-wide event loop.
     """
-    engine = create_async_engine(
-        str(test_settings.TEST_DATABASE_URL),
-        poolclass=NullPool,
-        echo=False,  # Set to True for SQL debugging
-    )
+    url = make_url(test_settings.TEST_DATABASE_URL)
+    if url.get_backend_name() == "sqlite":
+        # Each xdist worker is a separate process with its own in-memory DB
+        engine = _create_sqlite_engine(url)
+    else:
+        schema = _worker_schema()
+        connect_args = (
+            {"server_settings": {"search_path": schema}} if schema else {}
+        )
+        engine = create_async_engine(
+            url,
+            pool_size=5,
+            max_overflow=0,
+            pool_pre_ping=True,
+            connect_args=connect_args,
+            echo=False,  # Set to True for SQL debugging
+        )
     yield engine
     await engine.dispose()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 async def test_db_setup(test_engine):
     """
-    Set up and tear down the test database schema for each test.
+    Set up and tear down the test database schema for the test session.
     
     This fixture:
-    1. Creates all tables before the test
-    2. Yields control to the test
-    3. Drops all tables after the test
+    1. Creates all tables once before the first test
+    2. Yields control to the test session
+    3. Drops all tables after the last test
     
-    Using function scope ensures complete isolation between tests,
-    following the Interface Segregation Principle - each test gets
-    a clean database state.
+    Per-test isolation is not provided here but by db_session, which
+    rolls back every change a test makes. Keeping DDL out of the
+    per-test path means each test only pays for a BEGIN/ROLLBACK.
     """
     # Import all models to ensure they are registered with Base.metadata
     from src.models.task import Task  # noqa: F401
     from src.models.comment import Comment  # noqa: F401
     from src.models.notification import Notification  # noqa: F401
     
+    schema = _worker_schema()
+    if test_engine.dialect.name == "sqlite":
+        schema = None
+    
     async with test_engine.begin() as conn:
+        if schema:
+            await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
         # First drop all tables to ensure clean state
         await conn.run_sync(Base.metadata.drop_all)
         # Then create all tables
@@ -87,6 +178,8 @@ async def test_db_setup(test_engine):
     
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        if schema:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
 
 
 @pytest.fixture(scope="function")
@@ -94,37 +187,88 @@ async def db_session(test_engine, test_db_setup) -> AsyncGenerator[AsyncSession,
     """
     Provide a database session for each test function.
     
-    This fixture creates a new session for each test, ensuring isolation.
-    The session is automatically rolled back after the test to maintain
-    a clean state.
+    The session is bound to a connection with an outer transaction that
+    is never committed. Every commit() issued by the application or by
+    the factories only releases a SAVEPOINT (join_transaction_mode=
+    "create_savepoint"), so rolling back the outer transaction on
+    teardown discards everything the test wrote, leaving the schema
+    untouched for the next test.
     
     Yields:
         AsyncSession: A database session for the test to use
     """
-    async_session = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
 
 
 # ============================================================================
 # Application Fixtures
 # ============================================================================
 
+@pytest.fixture(scope="session")
+async def test_app() -> AsyncGenerator[FastAPI, None]:
+    """
+    Run the application's lifespan once for the whole test session.
+    
+    ASGITransport does not send lifespan events, so startup/shutdown
+    logic is driven here explicitly. Doing it at session scope means
+    any startup work is paid once per test process, not once per test.
+    
+    Yields:
+        FastAPI: The started application
+    """
+    async with app.router.lifespan_context(app):
+        yield app
+
+
+@pytest.fixture(scope="session")
+async def http_client(test_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Provide a single in-process HTTP client for the whole test session.
+    
+    Requests go straight to the ASGI app through ASGITransport, so there
+    is no socket or connection setup; building the client once avoids
+    paying its construction cost for every test. Tests should use the
+    client fixture, which wires the per-test database session in.
+    
+    A first request to the database-free root endpoint is sent before
+    the client is handed out: Starlette builds the middleware stack on the
+    first call, and that one-off cost should not land on whichever test
+    happens to run first.
+    
+    Yields:
+        AsyncClient: An HTTP client bound to the application
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=test_app),
+        base_url="http://test",
+        follow_redirects=True  # Follow 307 redirects automatically
+    ) as ac:
+        await ac.get("/")
+        yield ac
+
+
 @pytest.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(
+    http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
     """
     Provide an HTTP client for testing API endpoints.
     
     This fixture:
     1. Overrides the database dependency with the test database session
-    2. Creates an async HTTP client for making requests
-    3. Cleans up after the test
+    2. Hands out the session-wide HTTP client
+    3. Removes the override after the test
     
     Following the Dependency Inversion Principle, this allows tests to
     interact with the API through a stable interface while using a test
@@ -137,75 +281,110 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield http_client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="function")
+async def client_no_db(http_client: AsyncClient) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Provide an HTTP client for tests that never reach the database.
     
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-        follow_redirects=True  # Follow 307 redirects automatically
-    ) as ac:
-        yield ac
+    Requests without a token are rejected by the OAuth2 scheme before
+    any query runs, so 401 checks do not need db_session and its
+    per-test transaction. The database dependency resolves to None here,
+    so a test that unexpectedly queries it fails instead of touching a
+    real database.
+    
+    Yields:
+        AsyncClient: The session-wide HTTP client, with no database behind it
+    """
+    async def override_get_db():
+        return None
     
-    app.dependency_overrides.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield http_client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
 
 
 # ============================================================================
 # Authentication Fixtures
 # ============================================================================
 
-@pytest.fixture(scope="function")
-async def test_user_owner(db_session: AsyncSession) -> User:
+async def _create_session_user(
+    engine, email: str, password: str, role: UserRole
+) -> User:
+    """
+    Insert a user through a dedicated, committed session.
+    
+    Users created here live outside the per-test rollback performed by
+    db_session, so they are visible to every test of the session and the
+    password hash and JWT are computed only once per run.
+    """
+    async_session = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    async with async_session() as session:
+        user = User(
+            email=email,
+            hashed_password=get_password_hash(password),
+            role=role,
+            is_active=True
+        )
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+        return user
+
+
+@pytest.fixture(scope="session")
+async def test_user_owner(test_engine, test_db_setup) -> User:
     """
     Create a test user with OWNER role.
     
     This fixture provides a pre-configured owner user for tests that
-    require elevated permissions. Follows the Factory pattern for
-    creating test data.
+    require elevated permissions. The user is created once per session
+    and survives the per-test rollback.
     
     Returns:
         User: A user with OWNER role
     """
-    user = User(
-        email="owner@test.com",
-        hashed_password=get_password_hash("ownerpassword123"),
-        role=UserRole.OWNER,
-        is_active=True
+    return await _create_session_user(
+        test_engine, "owner@test.com", "ownerpassword123", UserRole.OWNER
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
 
 
-@pytest.fixture(scope="function")
-async def test_user_member(db_session: AsyncSession) -> User:
+@pytest.fixture(scope="session")
+async def test_user_member(test_engine, test_db_setup) -> User:
     """
     Create a test user with MEMBER role.
     
     This fixture provides a pre-configured member user for tests that
-    require standard user permissions.
+    require standard user permissions. The user is created once per
+    session and survives the per-test rollback.
     
     Returns:
         User: A user with MEMBER role
     """
-    user = User(
-        email="member@test.com",
-        hashed_password=get_password_hash("memberpassword123"),
-        role=UserRole.MEMBER,
-        is_active=True
+    return await _create_session_user(
+        test_engine, "member@test.com", "memberpassword123", UserRole.MEMBER
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def owner_token(test_user_owner: User) -> str:
     """
     Generate a JWT token for the owner user.
     
     This fixture creates a valid JWT token that can be used in
-    Authorization headers for authenticated requests.
+    Authorization headers for authenticated requests. It is signed
+    once per session, with an expiry far enough out to outlive any run.
     
     Args:
         test_user_owner: The owner user fixture
@@ -213,15 +392,19 @@ def owner_token(test_user_owner: User) -> str:
     Returns:
         str: A valid JWT token
     """
-    return create_access_token(subject=test_user_owner.email)
+    return create_access_token(
+        subject=test_user_owner.email, expires_delta=SESSION_TOKEN_TTL
+    )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def member_token(test_user_member: User) -> str:
     """
     Generate a JWT token for the member user.
     
-    This fixture creates a valid JWT token for a member user.
+    This fixture creates a valid JWT token for a member user. It is
+    signed once per session, with an expiry far enough out to outlive
+    any run.
     
     Args:
         test_user_member: The member user fixture
@@ -229,11 +412,13 @@ def member_token(test_user_member: User) -> str:
     Returns:
         str: A valid JWT token
     """
-    return create_access_token(subject=test_user_member.email)
+    return create_access_token(
+        subject=test_user_member.email, expires_delta=SESSION_TOKEN_TTL
+    )
 
 
-@pytest.fixture(scope="function")
-def auth_headers_owner(owner_token: str) -> dict:
+@pytest.fixture(scope="session")
+def auth_headers_owner(owner_token: str) -> Headers:
     """
     Create authentication headers for owner user.
     
@@ -241,17 +426,21 @@ def auth_headers_owner(owner_token: str) -> dict:
     Follows the Single Responsibility Principle - only handles
     header formatting.
     
+    The headers are built as an httpx.Headers instance once, so httpx
+    does not normalize them again on every request. The object is shared
+    by the whole session and must not be mutated by tests.
+    
     Args:
         owner_token: JWT token for owner user
         
     Returns:
-        dict: Headers dictionary with Authorization header
+        Headers: Headers with the Authorization header
     """
-    return {"Authorization": f"Bearer {owner_token}"}
+    return Headers({"Authorization": f"Bearer {owner_token}"})
 
 
-@pytest.fixture(scope="function")
-def auth_headers_member(member_token: str) -> dict:
+@pytest.fixture(scope="session")
+def auth_headers_member(member_token: str) -> Headers:
     """
     Create authentication headers for member user.
     
@@ -259,6 +448,116 @@ def auth_headers_member(member_token: str) -> dict:
         member_token: JWT token for member user
         
     Returns:
-        dict: Headers dictionary with Authorization header
+        Headers: Headers with the Authorization header
+    """
+    return Headers({"Authorization": f"Bearer {member_token}"})
+
+
+@pytest.fixture(scope="session")
+def json_headers_owner(owner_token: str) -> Headers:
+    """
+    Create owner auth headers for requests with a pre-serialized JSON body.
+    
+    Tests that send bytes through content= need the JSON content type
+    next to the Authorization header. Building the combined Headers once
+    avoids merging them into a new mapping on every request.
+    
+    Args:
+        owner_token: JWT token for owner user
+        
+    Returns:
+        Headers: Headers with the Authorization and Content-Type headers
+    """
+    return Headers({
+        "Authorization": f"Bearer {owner_token}",
+        "Content-Type": "application/json",
+    })
+
+
+@pytest.fixture(scope="session")
+def json_headers_member(member_token: str) -> Headers:
+    """
+    Create member auth headers for requests with a pre-serialized JSON body.
+    
+    Args:
+        member_token: JWT token for member user
+        
+    Returns:
+        Headers: Headers with the Authorization and Content-Type headers
     """
-    return {"Authorization": f"Bearer {member_token}"}
+    return Headers({
+        "Authorization": f"Bearer {member_token}",
+        "Content-Type": "application/json",
+    })
+
+
+# ============================================================================
+# Data Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="function")
+async def throwaway_task(db_session: AsyncSession, test_user_member: User) -> Task:
+    """
+    Provide a task owned by the member user.
+    
+    Many tests only need a task to satisfy foreign key constraints
+    (e.g. notifications or comments). Requesting this fixture keeps the
+    Arrange step short and lets pytest build the task once per test even
+    when several fixtures depend on it.
+    
+    Note:
+        Function scope is required: the task is written through
+        db_session, whose transaction is rolled back after every test.
+    
+    Returns:
+        Task: A task owned by test_user_member
+    """
+    return await TaskFactory.create_task(
+        db_session=db_session,
+        owner=test_user_member,
+        title="Throwaway Task"
+    )
+
+
+@pytest.fixture(scope="function")
+async def owner_task(db_session: AsyncSession, test_user_owner: User) -> Task:
+    """
+    Provide a single task with default fields owned by the owner user.
+    
+    Used by tests that only need some existing task to read, update,
+    delete or be denied access to; changes are rolled back per test.
+    
+    Note:
+        Function scope is required for the same reason as throwaway_task:
+        the task lives in the per-test transaction.
+    
+    Returns:
+        Task: A task owned by test_user_owner
+    """
+    return await TaskFactory.create_task(
+        db_session=db_session,
+        owner=test_user_owner
+    )
+
+
+@pytest.fixture(scope="function")
+async def owner_tasks(db_session: AsyncSession, test_user_owner: User) -> list[Task]:
+    """
+    Provide three tasks owned by the owner user.
+    
+    Shared baseline for tests that need an owner with existing tasks,
+    instead of each test calling TaskFactory.create_multiple_tasks.
+    
+    Note:
+        Function scope is required: a session-scoped set of tasks would be
+        visible to every test, and OWNER users list all tasks in the
+        system, which would break tests that expect an empty list.
+    
+    Returns:
+        list[Task]: Three tasks owned by test_user_owner
+    """
+    return await TaskFactory.create_multiple_tasks(
+        db_session=db_session,
+        owner=test_user_owner,
+        count=3
+    )
@@ -10,9 +10,16 @@ These factories make tests more readable and maintainable by:
 2. Providing sensible defaults
 3. Allowing customization when needed
 4. Reducing code duplication across tests
+
+Factories flush instead of committing: rows get their primary keys and are
+visible to the API through the same session, and the per-test rollback of
+db_session discards them without a COMMIT round trip per object.
 """
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from itertools import count as _count
 from typing import Optional
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.task import Task, TaskStatus
@@ -22,6 +29,32 @@ from src.models.notification import Notification, NotificationType
 from src.core.security import get_password_hash
 
 
+@lru_cache(maxsize=None)
+def _hashed_password(password: str) -> str:
+    """
+    Hash a test password once per process.
+    
+    Password hashing is deliberately slow, and factories are called with
+    the same handful of passwords over and over. The cached hash is a real
+    hash of the password, so the login endpoint still verifies it.
+    """
+    return get_password_hash(password)
+
+
+_email_sequence = _count(1)
+
+
+def unique_email(prefix: str = "user") -> str:
+    """
+    Return an email address that no other call in this process returns.
+    
+    Lets tests create users without picking addresses by hand, so two
+    factory calls (or a factory call and a session-wide user) never
+    collide on the unique email constraint.
+    """
+    return f"{prefix}{next(_email_sequence)}@example.com"
+
+
 class TaskFactory:
     """
     Factory for creating Task instances in tests.
@@ -76,7 +109,7 @@ class TaskFactory:
             **kwargs
         )
         db_session.add(task)
-        await db_session.commit()
+        await db_session.flush()
         await db_session.refresh(task)
         return task
     
@@ -157,6 +190,8 @@ class TaskFactory:
         Create multiple tasks at once.
         
         Useful for testing pagination, filtering, and bulk operations.
+        All rows are sent in a single bulk INSERT ... RETURNING statement
+        instead of one INSERT and refresh per task.
         
         Args:
             db_session: Database session to use
@@ -175,16 +210,21 @@ class TaskFactory:
                 status=TaskStatus.TODO
             )
         """
-        tasks = []
-        for i in range(count):
-            task = await TaskFactory.create_task(
-                db_session=db_session,
-                owner=owner,
-                title=f"Test Task {i+1}",
-                description=f"Description for task {i+1}",
-                **kwargs
-            )
-            tasks.append(task)
+        rows = [
+            {
+                "title": f"Test Task {i+1}",
+                "description": f"Description for task {i+1}",
+                "status": TaskStatus.TODO,
+                "owner_id": owner.id,
+                "due_date": None,
+                **kwargs,
+            }
+            for i in range(count)
+        ]
+        result = await db_session.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True), rows
+        )
+        tasks = list(result.all())
         return tasks
 
 
@@ -223,7 +263,7 @@ class CommentFactory:
             **kwargs
         )
         db_session.add(comment)
-        await db_session.commit()
+        await db_session.flush()
         await db_session.refresh(comment)
         return comment
     
@@ -352,6 +392,38 @@ class UserFactory:
     only responsible for user creation.
     """
     
+    @staticmethod
+    def build_user(
+        email: str,
+        password: str = "testpassword123",
+        role: UserRole = UserRole.MEMBER,
+        is_active: bool = True,
+        **kwargs
+    ) -> User:
+        """
+        Build a user without adding it to a session.
+        
+        Lets a test persist several users in one round trip with
+        db_session.add_all(...) followed by a single flush.
+        
+        Args:
+            email: User's email address
+            password: Plain text password (hashed once per process)
+            role: User role (default: UserRole.MEMBER)
+            is_active: Whether user is active (default: True)
+            **kwargs: Additional fields to set on the user
+            
+        Returns:
+            User: A transient user instance
+        """
+        return User(
+            email=email,
+            hashed_password=_hashed_password(password),
+            role=role,
+            is_active=is_active,
+            **kwargs
+        )
+    
     @staticmethod
     async def create_user(
         db_session: AsyncSession,
@@ -370,7 +442,7 @@ class UserFactory:
         Args:
             db_session: Database session to use
             email: User's email address
-            password: Plain text password (will be hashed)
+            password: Plain text password (hashed once per process)
             role: User role (default: UserRole.MEMBER)
             is_active: Whether user is active (default: True)
             **kwargs: Additional fields to set on the user
@@ -385,22 +457,22 @@ class UserFactory:
                 role=UserRole.OWNER
             )
         """
-        user = User(
+        user = UserFactory.build_user(
             email=email,
-            hashed_password=get_password_hash(password),
+            password=password,
             role=role,
             is_active=is_active,
             **kwargs
         )
         db_session.add(user)
-        await db_session.commit()
+        await db_session.flush()
         await db_session.refresh(user)
         return user
     
     @staticmethod
     async def create_owner(
         db_session: AsyncSession,
-        email: str = "owner@example.com",
+        email: Optional[str] = None,
         password: str = "ownerpassword123",
         **kwargs
     ) -> User:
@@ -411,7 +483,7 @@ class UserFactory:
         
         Args:
             db_session: Database session to use
-            email: User's email address
+            email: User's email address (default: a unique address)
             password: Plain text password
             **kwargs: Additional fields to pass to create_user
             
@@ -420,7 +492,7 @@ class UserFactory:
         """
         return await UserFactory.create_user(
             db_session=db_session,
-            email=email,
+            email=email or unique_email("owner"),
             password=password,
             role=UserRole.OWNER,
             **kwargs
@@ -429,7 +501,7 @@ class UserFactory:
     @staticmethod
     async def create_member(
         db_session: AsyncSession,
-        email: str = "member@example.com",
+        email: Optional[str] = None,
         password: str = "memberpassword123",
         **kwargs
     ) -> User:
@@ -440,7 +512,7 @@ class UserFactory:
         
         Args:
             db_session: Database session to use
-            email: User's email address
+            email: User's email address (default: a unique address)
             password: Plain text password
             **kwargs: Additional fields to pass to create_user
             
@@ -449,7 +521,7 @@ class UserFactory:
         """
         return await UserFactory.create_user(
             db_session=db_session,
-            email=email,
+            email=email or unique_email("member"),
             password=password,
             role=UserRole.MEMBER,
             **kwargs
@@ -458,7 +530,7 @@ class UserFactory:
     @staticmethod
     async def create_inactive_user(
         db_session: AsyncSession,
-        email: str = "inactive@example.com",
+        email: Optional[str] = None,
         password: str = "testpassword123",
         role: UserRole = UserRole.MEMBER,
         **kwargs
@@ -471,7 +543,7 @@ class UserFactory:
         
         Args:
             db_session: Database session to use
-            email: User's email address
+            email: User's email address (default: a unique address)
             password: Plain text password
             role: User role (default: UserRole.MEMBER)
             **kwargs: Additional fields to pass to create_user
@@ -481,7 +553,7 @@ class UserFactory:
         """
         return await UserFactory.create_user(
             db_session=db_session,
-            email=email,
+            email=email or unique_email("inactive"),
             password=password,
             role=role,
             is_active=False,
@@ -499,28 +571,34 @@ class UserFactory:
         """
         Create multiple users at once.
         
-        Useful for testing list endpoints and pagination.
+        Useful for testing list endpoints and pagination. All rows are
+        sent in a single bulk INSERT ... RETURNING statement instead of
+        one INSERT and refresh per user.
         
         Args:
             db_session: Database session to use
             count: Number of users to create
             role: Role for all users (default: UserRole.MEMBER)
             email_prefix: Prefix for email addresses
-            **kwargs: Additional fields to pass to create_user
+            **kwargs: Additional fields to pass to each user
             
         Returns:
             list[User]: List of created users
         """
-        users = []
-        for i in range(count):
-            user = await UserFactory.create_user(
-                db_session=db_session,
-                email=f"{email_prefix}{i+1}@example.com",
-                password=f"password{i+1}",
-                role=role,
-                **kwargs
-            )
-            users.append(user)
+        rows = [
+            {
+                "email": unique_email(email_prefix),
+                "hashed_password": _hashed_password(f"password{i+1}"),
+                "role": role,
+                "is_active": True,
+                **kwargs,
+            }
+            for i in range(count)
+        ]
+        result = await db_session.scalars(
+            insert(User).returning(User, sort_by_parameter_order=True), rows
+        )
+        users = list(result.all())
         return users
 
 
@@ -578,7 +656,7 @@ class NotificationFactory:
             **kwargs
         )
         db_session.add(notification)
-        await db_session.commit()
+        await db_session.flush()
         await db_session.refresh(notification)
         return notification
     
@@ -713,7 +791,9 @@ class NotificationFactory:
         """
         Create multiple notifications at once.
         
-        Useful for testing list endpoints and pagination.
+        Useful for testing list endpoints and pagination. All rows are
+        sent in a single bulk INSERT ... RETURNING statement instead of
+        one INSERT and refresh per notification.
         
         Args:
             db_session: Database session to use
@@ -721,22 +801,26 @@ class NotificationFactory:
             task: Task the notifications are about
             count: Number of notifications to create
             notification_type: Type for all notifications
-            **kwargs: Additional fields to pass to create_notification
+            **kwargs: Additional column values applied to every row
             
         Returns:
             list[Notification]: List of created notifications
         """
-        notifications = []
-        for i in range(count):
-            notification = await NotificationFactory.create_notification(
-                db_session=db_session,
-                user=user,
-                task=task,
-                message=f"Test notification {i+1}",
-                notification_type=notification_type,
-                **kwargs
-            )
-            notifications.append(notification)
+        rows = [
+            {
+                "message": f"Test notification {i+1}",
+                "notification_type": notification_type,
+                "user_id": user.id,
+                "task_id": task.id,
+                "is_read": False,
+                **kwargs,
+            }
+            for i in range(count)
+        ]
+        result = await db_session.scalars(
+            insert(Notification).returning(Notification, sort_by_parameter_order=True), rows
+        )
+        notifications = list(result.all())
         return notifications
 
 
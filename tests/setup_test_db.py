@@ -2,7 +2,8 @@
 Setup script for test database.
 
 This script creates the test database and applies migrations.
-Run this before running tests for the first time.
+Only needed when TEST_DATABASE_URL points at PostgreSQL; the default
+in-memory SQLite database is created by the test fixtures themselves.
 
 Usage:
     uv run python tests/setup_test_db.py
@@ -119,6 +120,11 @@ async def main():
     print("="*50)
     print()
     
+    if test_settings.TEST_DATABASE_URL.startswith("sqlite"):
+        print("TEST_DATABASE_URL uses in-memory SQLite: nothing to set up.")
+        print("Set TEST_DATABASE_URL to a PostgreSQL URL to prepare that database.")
+        return
+    
     try:
         await create_test_database()
         await create_tables()
@@ -10,6 +10,7 @@ Test Structure:
 - TestMarkNotificationAsRead: Tests for PUT /api/v1/notifications/{id}/read
 - TestDeleteNotification: Tests for DELETE /api/v1/notifications/{id}
 - TestCheckDueDates: Tests for POST /api/v1/notifications/check-due-dates
+- TestNotificationAuthentication: Authentication checks for all endpoints
 - TestNotificationIntegrationScenarios: Complex multi-step workflows
 
 Each test class follows SOLID principles:
@@ -18,19 +19,30 @@ Each test class follows SOLID principles:
 - Interface Segregation: Tests use only the fixtures they need
 - Dependency Inversion: Tests depend on fixtures (abstractions) not concrete implementations
 
-Note: Authentication tests are already covered in other test files,
-so we focus on notification-specific functionality and edge cases.
+Note: 401 checks for every endpoint live in TestNotificationAuthentication;
+the other classes focus on notification-specific functionality and edge cases.
 """
+import orjson
 import pytest
 from datetime import datetime, timedelta, timezone
-from httpx import AsyncClient
+from fastapi import HTTPException
+from httpx import AsyncClient, Headers
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
-from src.models.notification import NotificationType
+from src.models.task import Task, TaskStatus
+from src.models.notification import Notification, NotificationType
+from src.repositories.notification import NotificationRepository
+from src.repositories.task import TaskRepository
+from src.services.notification import NotificationService
 from tests.factories import TaskFactory, NotificationFactory, UserFactory
 
 
+# Pre-serialized request bodies, so httpx does not re-encode them per call.
+_DONE_STATUS_PAYLOAD = orjson.dumps({"status": "done"})
+
+
 # ============================================================================
 # GET /api/v1/notifications/ - List Notifications
 # ============================================================================
@@ -48,7 +60,7 @@ class TestGetNotifications:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test that user can retrieve their own notifications.
@@ -102,7 +114,8 @@ class TestGetNotifications:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers,
+        throwaway_task: Task
     ):
         """
         Test filtering notifications by unread status.
@@ -112,23 +125,18 @@ class TestGetNotifications:
         - Read notifications are excluded from results
         """
         # Arrange: Create read and unread notifications
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_member
-        )
-        
         # Create 2 unread notifications
         await NotificationFactory.create_notification(
             db_session=db_session,
             user=test_user_member,
-            task=task,
+            task=throwaway_task,
             message="Unread 1",
             is_read=False
         )
         await NotificationFactory.create_notification(
             db_session=db_session,
             user=test_user_member,
-            task=task,
+            task=throwaway_task,
             message="Unread 2",
             is_read=False
         )
@@ -137,7 +145,7 @@ class TestGetNotifications:
         await NotificationFactory.create_read_notification(
             db_session=db_session,
             user=test_user_member,
-            task=task
+            task=throwaway_task
         )
         
         # Act: Get only unread notifications
@@ -158,7 +166,7 @@ class TestGetNotifications:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test pagination parameters (skip and limit).
@@ -196,7 +204,7 @@ class TestGetNotifications:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test that users can only see their own notifications.
@@ -207,8 +215,7 @@ class TestGetNotifications:
         """
         # Arrange: Create another user with notifications
         other_user = await UserFactory.create_member(
-            db_session=db_session,
-            email="other@test.com"
+            db_session=db_session
         )
         
         other_task = await TaskFactory.create_task(
@@ -248,22 +255,6 @@ class TestGetNotifications:
         assert len(data) == 1
         assert data[0]["id"] == user_notification.id
         assert data[0]["message"] == "User's notification"
-    
-    async def test_get_notifications_requires_authentication(
-        self,
-        client: AsyncClient
-    ):
-        """
-        Test that the endpoint requires authentication.
-        
-        Validates:
-        - Status code is 401 when no token is provided
-        """
-        # Act: Try to get notifications without authentication
-        response = await client.get("/api/v1/notifications/")
-        
-        # Assert: Verify unauthorized response
-        assert response.status_code == 401
 
 
 # ============================================================================
@@ -282,7 +273,8 @@ class TestGetUnreadCount:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers,
+        throwaway_task: Task
     ):
         """
         Test that unread count is accurate.
@@ -293,17 +285,12 @@ class TestGetUnreadCount:
         - Read notifications are not counted
         """
         # Arrange: Create read and unread notifications
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_member
-        )
-        
         # Create 3 unread notifications
         for _ in range(3):
             await NotificationFactory.create_notification(
                 db_session=db_session,
                 user=test_user_member,
-                task=task,
+                task=throwaway_task,
                 is_read=False
             )
         
@@ -312,7 +299,7 @@ class TestGetUnreadCount:
             await NotificationFactory.create_read_notification(
                 db_session=db_session,
                 user=test_user_member,
-                task=task
+                task=throwaway_task
             )
         
         # Act: Get unread count
@@ -323,7 +310,7 @@ class TestGetUnreadCount:
         
         # Assert: Verify count
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "unread_count" in data
         assert data["unread_count"] == 3
     
@@ -331,7 +318,7 @@ class TestGetUnreadCount:
         self,
         client: AsyncClient,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test that count is zero when user has no notifications.
@@ -347,24 +334,8 @@ class TestGetUnreadCount:
         
         # Assert: Verify zero count
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["unread_count"] == 0
-    
-    async def test_get_unread_count_requires_authentication(
-        self,
-        client: AsyncClient
-    ):
-        """
-        Test that the endpoint requires authentication.
-        
-        Validates:
-        - Status code is 401 when no token is provided
-        """
-        # Act: Try to get count without authentication
-        response = await client.get("/api/v1/notifications/unread-count")
-        
-        # Assert: Verify unauthorized response
-        assert response.status_code == 401
 
 
 # ============================================================================
@@ -383,7 +354,8 @@ class TestMarkNotificationAsRead:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers,
+        throwaway_task: Task
     ):
         """
         Test successfully marking a notification as read.
@@ -394,15 +366,10 @@ class TestMarkNotificationAsRead:
         - Response contains updated notification
         """
         # Arrange: Create an unread notification
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_member
-        )
-        
         notification = await NotificationFactory.create_notification(
             db_session=db_session,
             user=test_user_member,
-            task=task,
+            task=throwaway_task,
             is_read=False
         )
         
@@ -421,7 +388,7 @@ class TestMarkNotificationAsRead:
     async def test_mark_notification_as_read_not_found(
         self,
         client: AsyncClient,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test marking non-existent notification returns 404.
@@ -443,7 +410,7 @@ class TestMarkNotificationAsRead:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test that users cannot mark other users' notifications as read.
@@ -453,8 +420,7 @@ class TestMarkNotificationAsRead:
         """
         # Arrange: Create notification for another user
         other_user = await UserFactory.create_member(
-            db_session=db_session,
-            email="other@test.com"
+            db_session=db_session
         )
         
         other_task = await TaskFactory.create_task(
@@ -476,22 +442,6 @@ class TestMarkNotificationAsRead:
         
         # Assert: Verify not found response (404 to not leak notification existence)
         assert response.status_code == 404
-    
-    async def test_mark_notification_as_read_requires_authentication(
-        self,
-        client: AsyncClient
-    ):
-        """
-        Test that the endpoint requires authentication.
-        
-        Validates:
-        - Status code is 401 when no token is provided
-        """
-        # Act: Try to mark notification without authentication
-        response = await client.put("/api/v1/notifications/1/read")
-        
-        # Assert: Verify unauthorized response
-        assert response.status_code == 401
 
 
 # ============================================================================
@@ -510,7 +460,7 @@ class TestDeleteNotification:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test successfully deleting a notification.
@@ -553,30 +503,35 @@ class TestDeleteNotification:
     
     async def test_delete_notification_not_found(
         self,
-        client: AsyncClient,
-        auth_headers_member: dict
+        db_session: AsyncSession,
+        test_user_member: User
     ):
         """
         Test deleting non-existent notification returns 404.
         
+        Calls the service layer directly: routing and authentication are
+        covered by the other tests of this class.
+        
         Validates:
         - Status code is 404 for invalid notification ID
         """
         # Act: Try to delete non-existent notification
-        response = await client.delete(
-            "/api/v1/notifications/99999",
-            headers=auth_headers_member
-        )
+        with pytest.raises(HTTPException) as exc_info:
+            await NotificationService.delete_notification(
+                db=db_session,
+                notification_id=99999,
+                current_user=test_user_member
+            )
         
         # Assert: Verify not found response
-        assert response.status_code == 404
+        assert exc_info.value.status_code == 404
     
     async def test_delete_notification_forbidden_for_other_user(
         self,
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test that users cannot delete other users' notifications.
@@ -586,8 +541,7 @@ class TestDeleteNotification:
         """
         # Arrange: Create notification for another user
         other_user = await UserFactory.create_member(
-            db_session=db_session,
-            email="other@test.com"
+            db_session=db_session
         )
         
         other_task = await TaskFactory.create_task(
@@ -609,22 +563,6 @@ class TestDeleteNotification:
         
         # Assert: Verify not found response (404 to not leak notification existence)
         assert response.status_code == 404
-    
-    async def test_delete_notification_requires_authentication(
-        self,
-        client: AsyncClient
-    ):
-        """
-        Test that the endpoint requires authentication.
-        
-        Validates:
-        - Status code is 401 when no token is provided
-        """
-        # Act: Try to delete notification without authentication
-        response = await client.delete("/api/v1/notifications/1")
-        
-        # Assert: Verify unauthorized response
-        assert response.status_code == 401
 
 
 # ============================================================================
@@ -644,7 +582,7 @@ class TestCheckDueDates:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_owner: User,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test generating notifications for overdue tasks.
@@ -690,7 +628,7 @@ class TestCheckDueDates:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_owner: User,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test generating notifications for tasks due today.
@@ -727,7 +665,7 @@ class TestCheckDueDates:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_owner: User,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test generating notifications for tasks due soon (within 24 hours).
@@ -761,7 +699,7 @@ class TestCheckDueDates:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_owner: User,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test that running check multiple times doesn't create duplicates.
@@ -798,10 +736,155 @@ class TestCheckDueDates:
         # Second run should create 0 for the same task
         assert data2["total"] == 0 or data2["total"] < data1["total"]
     
+    async def test_create_due_date_notifications_classifies_and_deduplicates(
+        self,
+        db_session: AsyncSession,
+        test_user_owner: User
+    ):
+        """
+        Test the single-statement due-date notification insert.
+        
+        Calls the repository directly with fixed instants so the buckets do not
+        depend on the time of day the suite runs. Runs on every configured
+        backend, including PostgreSQL, where the notification type is a native enum.
+        
+        Validates:
+        - Overdue, due today and due soon tasks get the matching notification type
+        - Messages contain the task title and the bucket wording
+        - Done tasks and tasks due after tomorrow are ignored
+        - A second run creates nothing while the notifications are unread
+        - A read notification no longer counts as a duplicate
+        """
+        # Arrange: One task per bucket plus two tasks that must be ignored
+        now = datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
+        today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+        tomorrow_end = today_end + timedelta(days=1)
+        
+        overdue_task = await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Overdue Task",
+            due_date=now - timedelta(hours=6)
+        )
+        today_task = await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Today Task",
+            due_date=now + timedelta(hours=6)
+        )
+        soon_task = await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Soon Task",
+            due_date=now + timedelta(days=1)
+        )
+        done_task = await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Done Task",
+            status=TaskStatus.DONE,
+            due_date=now - timedelta(hours=6)
+        )
+        later_task = await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Later Task",
+            due_date=now + timedelta(days=3)
+        )
+        task_ids = [t.id for t in (overdue_task, today_task, soon_task, done_task, later_task)]
+        
+        # Act: Generate notifications
+        created = await NotificationRepository.create_due_date_notifications(
+            db_session, now=now, today_end=today_end, tomorrow_end=tomorrow_end
+        )
+        
+        # Assert: One notification per eligible task, with type and message
+        assert sorted(created) == sorted([
+            NotificationType.OVERDUE,
+            NotificationType.DUE_TODAY,
+            NotificationType.DUE_SOON
+        ])
+        result = await db_session.scalars(
+            select(Notification).where(Notification.task_id.in_(task_ids))
+        )
+        notifications = {n.task_id: n for n in result.all()}
+        assert set(notifications) == {overdue_task.id, today_task.id, soon_task.id}
+        
+        assert notifications[overdue_task.id].notification_type == NotificationType.OVERDUE
+        assert notifications[overdue_task.id].message == "Task 'Overdue Task' is overdue"
+        assert notifications[today_task.id].notification_type == NotificationType.DUE_TODAY
+        assert notifications[today_task.id].message == "Task 'Today Task' is due today"
+        assert notifications[soon_task.id].notification_type == NotificationType.DUE_SOON
+        assert notifications[soon_task.id].message == "Task 'Soon Task' is due soon"
+        assert all(n.user_id == test_user_owner.id for n in notifications.values())
+        assert not any(n.is_read for n in notifications.values())
+        
+        # Act: Run again while the notifications are still unread
+        created_again = await NotificationRepository.create_due_date_notifications(
+            db_session, now=now, today_end=today_end, tomorrow_end=tomorrow_end
+        )
+        
+        # Assert: Unread notifications of the same type are not duplicated
+        assert created_again == []
+        
+        # Act: Read the overdue notification and run once more
+        await NotificationRepository.mark_as_read(db_session, notifications[overdue_task.id])
+        created_after_read = await NotificationRepository.create_due_date_notifications(
+            db_session, now=now, today_end=today_end, tomorrow_end=tomorrow_end
+        )
+        
+        # Assert: Only the task whose notification was read is notified again
+        assert created_after_read == [NotificationType.OVERDUE]
+    
+    async def test_has_pending_due_before_ignores_done_and_later_tasks(
+        self,
+        db_session: AsyncSession,
+        test_user_owner: User
+    ):
+        """
+        Test the existence probe that lets the due-date job skip its insert.
+        
+        Uses a horizon far in the past so tasks created by other fixtures
+        cannot match.
+        
+        Validates:
+        - Done tasks and tasks due after the horizon do not count
+        - An unfinished task due before the horizon does
+        """
+        # Arrange: Only tasks that must be ignored
+        horizon = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Done Task",
+            status=TaskStatus.DONE,
+            due_date=horizon - timedelta(days=1)
+        )
+        await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Later Task",
+            due_date=horizon + timedelta(days=1)
+        )
+        
+        # Act & Assert: Nothing is pending before the horizon
+        assert not await TaskRepository.has_pending_due_before(db_session, horizon)
+        
+        # Arrange: An unfinished task due before the horizon
+        await TaskFactory.create_task(
+            db_session=db_session,
+            owner=test_user_owner,
+            title="Pending Task",
+            due_date=horizon - timedelta(days=1)
+        )
+        
+        # Act & Assert: The probe now finds it
+        assert await TaskRepository.has_pending_due_before(db_session, horizon)
+    
     async def test_check_due_dates_requires_owner_role(
         self,
         client: AsyncClient,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test that only owners can check due dates.
@@ -817,10 +900,35 @@ class TestCheckDueDates:
         
         # Assert: Verify forbidden response
         assert response.status_code == 403
+
+
+# ============================================================================
+# Authentication
+# ============================================================================
+
+class TestNotificationAuthentication:
+    """
+    Tests that every notification endpoint requires authentication.
+    
+    A single parametrized test covers all endpoints, so the 401 check is
+    written once and new endpoints only need a new parameter.
+    """
     
-    async def test_check_due_dates_requires_authentication(
+    @pytest.mark.parametrize(
+        "method, url",
+        [
+            ("get", "/api/v1/notifications/"),
+            ("get", "/api/v1/notifications/unread-count"),
+            ("put", "/api/v1/notifications/1/read"),
+            ("delete", "/api/v1/notifications/1"),
+            ("post", "/api/v1/notifications/check-due-dates"),
+        ],
+    )
+    async def test_endpoint_requires_authentication(
         self,
-        client: AsyncClient
+        client_no_db: AsyncClient,
+        method: str,
+        url: str
     ):
         """
         Test that the endpoint requires authentication.
@@ -828,8 +936,8 @@ class TestCheckDueDates:
         Validates:
         - Status code is 401 when no token is provided
         """
-        # Act: Try to check due dates without authentication
-        response = await client.post("/api/v1/notifications/check-due-dates")
+        # Act: Call the endpoint without authentication
+        response = await getattr(client_no_db, method)(url)
         
         # Assert: Verify unauthorized response
         assert response.status_code == 401
@@ -852,7 +960,7 @@ class TestNotificationIntegrationScenarios:
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test complete notification workflow: create → read → mark as read → delete.
@@ -882,7 +990,7 @@ class TestNotificationIntegrationScenarios:
             "/api/v1/notifications/unread-count",
             headers=auth_headers_member
         )
-        assert count_response.json()["unread_count"] == 1
+        assert orjson.loads(count_response.content)["unread_count"] == 1
         
         # Act 2: Get notifications list
         list_response = await client.get(
@@ -906,7 +1014,7 @@ class TestNotificationIntegrationScenarios:
             "/api/v1/notifications/unread-count",
             headers=auth_headers_member
         )
-        assert count_response2.json()["unread_count"] == 0
+        assert orjson.loads(count_response2.content)["unread_count"] == 0
         
         # Act 5: Delete notification
         delete_response = await client.delete(
@@ -920,14 +1028,14 @@ class TestNotificationIntegrationScenarios:
             "/api/v1/notifications/",
             headers=auth_headers_member
         )
-        assert len(final_list.json()) == 0
+        assert final_list.content == b"[]"
     
     async def test_task_deletion_cascades_to_notifications(
         self,
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_member: User,
-        auth_headers_member: dict
+        auth_headers_member: Headers
     ):
         """
         Test that deleting a task also deletes its notifications.
@@ -968,14 +1076,15 @@ class TestNotificationIntegrationScenarios:
             "/api/v1/notifications/",
             headers=auth_headers_member
         )
-        assert len(final_notif_response.json()) == 0
+        assert final_notif_response.content == b"[]"
     
     async def test_due_date_workflow_with_task_completion(
         self,
         client: AsyncClient,
         db_session: AsyncSession,
         test_user_owner: User,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers,
+        json_headers_owner: Headers
     ):
         """
         Test that completing a task prevents further due date notifications.
@@ -1002,8 +1111,8 @@ class TestNotificationIntegrationScenarios:
         # Act 2: Complete the task
         update_response = await client.put(
             f"/api/v1/tasks/{overdue_task.id}",
-            json={"status": "done"},
-            headers=auth_headers_owner
+            content=_DONE_STATUS_PAYLOAD,
+            headers=json_headers_owner
         )
         assert update_response.status_code == 200
         
@@ -16,11 +16,16 @@ Following SOLID principles:
 - Dependency Inversion: Tests depend on abstractions (fixtures)
 - Interface Segregation: Tests use only the fixtures they need
 """
+import orjson
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, Headers
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.user import User
-from src.models.task import TaskStatus
-from tests.factories import TaskFactory, TestDataBuilder
+from src.models.task import Task
+from src.models.comment import Comment
+from src.services.task import TaskService
+from tests.factories import CommentFactory, TaskFactory, TestDataBuilder
 
 
 # ============================================================================
@@ -30,13 +35,12 @@ from tests.factories import TaskFactory, TestDataBuilder
 class TestListTasks:
     """Test suite for listing tasks endpoint."""
     
-    @pytest.mark.asyncio
     async def test_list_tasks_returns_user_tasks(
         self,
         client: AsyncClient,
         test_user_owner: User,
-        auth_headers_owner: dict,
-        db_session
+        auth_headers_owner: Headers,
+        owner_tasks: list[Task]
     ):
         """
         Test that listing tasks returns only the authenticated user's tasks.
@@ -46,13 +50,6 @@ class TestListTasks:
         - Only tasks belonging to the user are returned
         - Response structure is correct
         """
-        # Arrange: Create tasks for the authenticated user
-        tasks = await TaskFactory.create_multiple_tasks(
-            db_session=db_session,
-            owner=test_user_owner,
-            count=3
-        )
-        
         # Act: Request the user's tasks
         response = await client.get(
             "/api/v1/tasks",
@@ -61,7 +58,7 @@ class TestListTasks:
         
         # Assert: Verify response
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert isinstance(data, list)
         assert len(data) == 3
         
@@ -72,57 +69,37 @@ class TestListTasks:
             assert "title" in task_data
             assert "status" in task_data
     
-    @pytest.mark.asyncio
     async def test_list_tasks_empty_for_new_user(
         self,
-        client: AsyncClient,
-        auth_headers_member: dict
+        db_session: AsyncSession,
+        test_user_member: User
     ):
         """
         Test that a new user with no tasks receives an empty list.
         
+        Calls the service layer directly: the HTTP path of this endpoint
+        is covered by the other tests of this class.
+        
         Verifies:
         - Empty list is returned for users without tasks
         - No errors occur when user has no tasks
         """
         # Act: Request tasks for user with no tasks
-        response = await client.get(
-            "/api/v1/tasks",
-            headers=auth_headers_member
+        tasks = await TaskService.get_tasks_for_user(
+            db=db_session,
+            user=test_user_member
         )
         
         # Assert: Verify empty list
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) == 0
+        assert tasks == []
     
-    @pytest.mark.asyncio
-    async def test_list_tasks_requires_authentication(
-        self,
-        client: AsyncClient
-    ):
-        """
-        Test that listing tasks requires authentication.
-        
-        Verifies:
-        - Unauthenticated requests are rejected
-        - Appropriate error code is returned
-        """
-        # Act: Request without authentication headers
-        response = await client.get("/api/v1/tasks")
-        
-        # Assert: Verify unauthorized response
-        assert response.status_code == 401
-    
-    @pytest.mark.asyncio
     async def test_list_tasks_does_not_show_other_users_tasks(
         self,
         client: AsyncClient,
         test_user_owner: User,
         test_user_member: User,
-        auth_headers_member: dict,
-        db_session
+        auth_headers_member: Headers,
+        owner_tasks: list[Task]
     ):
         """
         Test that users cannot see other users' tasks.
@@ -131,13 +108,6 @@ class TestListTasks:
         - Task isolation between users
         - Privacy and security of task data
         """
-        # Arrange: Create tasks for owner user
-        await TaskFactory.create_multiple_tasks(
-            db_session=db_session,
-            owner=test_user_owner,
-            count=3
-        )
-        
         # Act: Request as member user
         response = await client.get(
             "/api/v1/tasks",
@@ -146,7 +116,7 @@ class TestListTasks:
         
         # Assert: Member sees no tasks
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert len(data) == 0
 
 
@@ -157,12 +127,11 @@ class TestListTasks:
 class TestCreateTask:
     """Test suite for creating tasks endpoint."""
     
-    @pytest.mark.asyncio
     async def test_create_task_success(
         self,
         client: AsyncClient,
         test_user_owner: User,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test successful task creation with valid data.
@@ -196,11 +165,10 @@ class TestCreateTask:
         assert "id" in data
         assert "created_at" in data
     
-    @pytest.mark.asyncio
     async def test_create_task_with_due_date(
         self,
         client: AsyncClient,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test creating a task with a due date.
@@ -230,11 +198,10 @@ class TestCreateTask:
         assert "due_date" in data
         assert data["due_date"] is not None
     
-    @pytest.mark.asyncio
     async def test_create_task_minimal_data(
         self,
         client: AsyncClient,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test creating a task with only required fields.
@@ -262,35 +229,10 @@ class TestCreateTask:
         assert data["status"] == "todo"  # Default status
         assert data["description"] is None  # Optional field
     
-    @pytest.mark.asyncio
-    async def test_create_task_requires_authentication(
-        self,
-        client: AsyncClient
-    ):
-        """
-        Test that creating a task requires authentication.
-        
-        Verifies:
-        - Unauthenticated requests are rejected
-        - No task is created without auth
-        """
-        # Arrange: Task data
-        task_data = {"title": "Unauthorized Task"}
-        
-        # Act: Attempt to create without auth
-        response = await client.post(
-            "/api/v1/tasks",
-            json=task_data
-        )
-        
-        # Assert: Verify rejection
-        assert response.status_code == 401
-    
-    @pytest.mark.asyncio
     async def test_create_task_validates_required_fields(
         self,
         client: AsyncClient,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test that task creation validates required fields.
@@ -312,11 +254,10 @@ class TestCreateTask:
         # Assert: Verify validation error
         assert response.status_code == 422  # Validation error
     
-    @pytest.mark.asyncio
     async def test_create_task_validates_status_enum(
         self,
         client: AsyncClient,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test that invalid status values are rejected.
@@ -349,12 +290,11 @@ class TestCreateTask:
 class TestGetTask:
     """Test suite for retrieving a single task endpoint."""
     
-    @pytest.mark.asyncio
     async def test_get_task_success(
         self,
         client: AsyncClient,
         test_user_owner: User,
-        auth_headers_owner: dict,
+        auth_headers_owner: Headers,
         db_session
     ):
         """
@@ -383,83 +323,6 @@ class TestGetTask:
         assert data["id"] == task.id
         assert data["title"] == "Specific Task"
         assert data["owner_id"] == test_user_owner.id
-    
-    @pytest.mark.asyncio
-    async def test_get_task_not_found(
-        self,
-        client: AsyncClient,
-        auth_headers_owner: dict
-    ):
-        """
-        Test retrieving a non-existent task.
-        
-        Verifies:
-        - 404 error is returned for non-existent task
-        - Appropriate error message
-        """
-        # Act: Request non-existent task
-        response = await client.get(
-            "/api/v1/tasks/99999",
-            headers=auth_headers_owner
-        )
-        
-        # Assert: Verify not found
-        assert response.status_code == 404
-    
-    @pytest.mark.asyncio
-    async def test_get_task_forbidden_for_other_user(
-        self,
-        client: AsyncClient,
-        test_user_owner: User,
-        auth_headers_member: dict,
-        db_session
-    ):
-        """
-        Test that users cannot access other users' tasks.
-        
-        Verifies:
-        - Task privacy is enforced
-        - 403 or 404 error is returned
-        """
-        # Arrange: Create task for owner
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_owner
-        )
-        
-        # Act: Try to access as member
-        response = await client.get(
-            f"/api/v1/tasks/{task.id}",
-            headers=auth_headers_member
-        )
-        
-        # Assert: Verify access denied
-        assert response.status_code in [403, 404]
-    
-    @pytest.mark.asyncio
-    async def test_get_task_requires_authentication(
-        self,
-        client: AsyncClient,
-        test_user_owner: User,
-        db_session
-    ):
-        """
-        Test that retrieving a task requires authentication.
-        
-        Verifies:
-        - Unauthenticated requests are rejected
-        """
-        # Arrange: Create a task
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_owner
-        )
-        
-        # Act: Request without auth
-        response = await client.get(f"/api/v1/tasks/{task.id}")
-        
-        # Assert: Verify rejection
-        assert response.status_code == 401
 
 
 # ============================================================================
@@ -469,13 +332,11 @@ class TestGetTask:
 class TestUpdateTask:
     """Test suite for updating tasks endpoint."""
     
-    @pytest.mark.asyncio
     async def test_update_task_success(
         self,
         client: AsyncClient,
-        test_user_owner: User,
-        auth_headers_owner: dict,
-        db_session
+        owner_task: Task,
+        auth_headers_owner: Headers
     ):
         """
         Test successfully updating a task.
@@ -485,15 +346,8 @@ class TestUpdateTask:
         - Updated fields are reflected in response
         - Unchanged fields remain the same
         """
-        # Arrange: Create a task
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_owner,
-            title="Original Title",
-            status=TaskStatus.TODO
-        )
-        
-        # Prepare update data
+        # Arrange: Prepare update data for the owner's task
+        task_id = owner_task.id
         update_data = {
             "title": "Updated Title",
             "status": "in_progress"
@@ -501,7 +355,7 @@ class TestUpdateTask:
         
         # Act: Update the task
         response = await client.put(
-            f"/api/v1/tasks/{task.id}",
+            f"/api/v1/tasks/{task_id}",
             json=update_data,
             headers=auth_headers_owner
         )
@@ -511,15 +365,13 @@ class TestUpdateTask:
         data = response.json()
         assert data["title"] == "Updated Title"
         assert data["status"] == "in_progress"
-        assert data["id"] == task.id
+        assert data["id"] == task_id
     
-    @pytest.mark.asyncio
     async def test_update_task_partial_update(
         self,
         client: AsyncClient,
-        test_user_owner: User,
-        auth_headers_owner: dict,
-        db_session
+        owner_task: Task,
+        auth_headers_owner: Headers
     ):
         """
         Test partial update of a task (only some fields).
@@ -528,21 +380,18 @@ class TestUpdateTask:
         - Only provided fields are updated
         - Other fields remain unchanged
         """
-        # Arrange: Create a task
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_owner,
-            title="Original Title",
-            description="Original Description",
-            status=TaskStatus.TODO
-        )
+        # Arrange: Remember the original values (the ORM object is updated
+        # in place by the request, since it shares the test session)
+        task_id = owner_task.id
+        original_title = owner_task.title
+        original_description = owner_task.description
         
         # Update only status
         update_data = {"status": "done"}
         
         # Act: Update
         response = await client.put(
-            f"/api/v1/tasks/{task.id}",
+            f"/api/v1/tasks/{task_id}",
             json=update_data,
             headers=auth_headers_owner
         )
@@ -551,61 +400,8 @@ class TestUpdateTask:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "done"
-        assert data["title"] == "Original Title"
-        assert data["description"] == "Original Description"
-    
-    @pytest.mark.asyncio
-    async def test_update_task_forbidden_for_other_user(
-        self,
-        client: AsyncClient,
-        test_user_owner: User,
-        auth_headers_member: dict,
-        db_session
-    ):
-        """
-        Test that users cannot update other users' tasks.
-        
-        Verifies:
-        - Update permission is enforced
-        - 403 or 404 error is returned
-        """
-        # Arrange: Create task for owner
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_owner
-        )
-        
-        # Act: Try to update as member
-        response = await client.put(
-            f"/api/v1/tasks/{task.id}",
-            json={"title": "Hacked Title"},
-            headers=auth_headers_member
-        )
-        
-        # Assert: Verify access denied
-        assert response.status_code in [403, 404]
-    
-    @pytest.mark.asyncio
-    async def test_update_task_not_found(
-        self,
-        client: AsyncClient,
-        auth_headers_owner: dict
-    ):
-        """
-        Test updating a non-existent task.
-        
-        Verifies:
-        - 404 error is returned
-        """
-        # Act: Update non-existent task
-        response = await client.put(
-            "/api/v1/tasks/99999",
-            json={"title": "New Title"},
-            headers=auth_headers_owner
-        )
-        
-        # Assert: Verify not found
-        assert response.status_code == 404
+        assert data["title"] == original_title
+        assert data["description"] == original_description
 
 
 # ============================================================================
@@ -615,13 +411,12 @@ class TestUpdateTask:
 class TestDeleteTask:
     """Test suite for deleting tasks endpoint."""
     
-    @pytest.mark.asyncio
     async def test_delete_task_success(
         self,
         client: AsyncClient,
-        test_user_owner: User,
-        auth_headers_owner: dict,
-        db_session
+        owner_task: Task,
+        auth_headers_owner: Headers,
+        db_session: AsyncSession
     ):
         """
         Test successfully deleting a task.
@@ -629,14 +424,9 @@ class TestDeleteTask:
         Verifies:
         - Task owner can delete their task
         - Task is actually removed from database
-        - Subsequent requests return 404
         """
-        # Arrange: Create a task
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_owner
-        )
-        task_id = task.id
+        # Arrange: Use the owner's task
+        task_id = owner_task.id
         
         # Act: Delete the task
         response = await client.delete(
@@ -647,108 +437,171 @@ class TestDeleteTask:
         # Assert: Verify deletion
         assert response.status_code == 204
         
-        # Verify task no longer exists
-        get_response = await client.get(
-            f"/api/v1/tasks/{task_id}",
-            headers=auth_headers_owner
-        )
-        assert get_response.status_code == 404
+        # Verify task no longer exists (checked in the database directly)
+        remaining = await db_session.scalar(select(Task.id).where(Task.id == task_id))
+        assert remaining is None
     
-    @pytest.mark.asyncio
-    async def test_delete_task_forbidden_for_other_user(
+    async def test_delete_task_cascades_to_comments(
         self,
         client: AsyncClient,
         test_user_owner: User,
-        auth_headers_member: dict,
+        auth_headers_owner: Headers,
         db_session
     ):
         """
-        Test that users cannot delete other users' tasks.
+        Test that deleting a task also deletes associated comments.
         
         Verifies:
-        - Delete permission is enforced
-        - Task remains in database
+        - Cascade deletion works correctly
+        - Related data is cleaned up
         """
-        # Arrange: Create task for owner
+        # Arrange: Create task with comments
         task = await TaskFactory.create_task(
             db_session=db_session,
             owner=test_user_owner
         )
         
-        # Act: Try to delete as member
+        await CommentFactory.create_comment(
+            db_session=db_session,
+            task=task,
+            author=test_user_owner
+        )
+        
+        # Act: Delete the task
         response = await client.delete(
             f"/api/v1/tasks/{task.id}",
-            headers=auth_headers_member
+            headers=auth_headers_owner
         )
         
-        # Assert: Verify access denied
-        assert response.status_code in [403, 404]
+        # Assert: Task and comments deleted
+        assert response.status_code == 204
+        
+        # Verify no comments remain for the task (checked in the database directly)
+        remaining = await db_session.scalar(
+            select(Comment.id).where(Comment.task_id == task.id)
+        )
+        assert remaining is None
+
+
+# ============================================================================
+# Access Control Across GET/PUT/DELETE /api/v1/tasks/{id}
+# ============================================================================
+
+class TestTaskAccessControl:
+    """
+    Tests for the checks shared by the single-task endpoints.
     
-    @pytest.mark.asyncio
-    async def test_delete_task_not_found(
+    GET, PUT and DELETE go through the same lookup and ownership checks,
+    so each check is written once and parametrized over the methods.
+    """
+    
+    @pytest.mark.parametrize(
+        "method, extra",
+        [
+            ("get", {}),
+            ("put", {"json": {"title": "Hacked Title"}}),
+            ("delete", {}),
+        ],
+    )
+    async def test_task_forbidden_for_other_user(
         self,
         client: AsyncClient,
-        auth_headers_owner: dict
+        owner_task: Task,
+        auth_headers_member: Headers,
+        method: str,
+        extra: dict
     ):
         """
-        Test deleting a non-existent task.
+        Test that users cannot access, update or delete other users' tasks.
         
         Verifies:
-        - 404 error is returned
+        - Task privacy is enforced for every method
+        - 404 is returned, so the task's existence is not disclosed
         """
-        # Act: Delete non-existent task
-        response = await client.delete(
-            "/api/v1/tasks/99999",
-            headers=auth_headers_owner
+        # Act: Call the endpoint on the owner's task as member
+        response = await getattr(client, method)(
+            f"/api/v1/tasks/{owner_task.id}",
+            headers=auth_headers_member,
+            **extra
         )
         
-        # Assert: Verify not found
+        # Assert: Verify access denied as "not found"
         assert response.status_code == 404
     
-    @pytest.mark.asyncio
-    async def test_delete_task_cascades_to_comments(
+    @pytest.mark.parametrize(
+        "method, extra",
+        [
+            ("get", {}),
+            ("put", {"json": {"title": "New Title"}}),
+            ("delete", {}),
+        ],
+    )
+    async def test_task_not_found(
         self,
         client: AsyncClient,
-        test_user_owner: User,
-        auth_headers_owner: dict,
-        db_session
+        auth_headers_owner: Headers,
+        method: str,
+        extra: dict
     ):
         """
-        Test that deleting a task also deletes associated comments.
+        Test calling the endpoint on a non-existent task.
         
         Verifies:
-        - Cascade deletion works correctly
-        - Related data is cleaned up
+        - 404 error is returned for every method
         """
-        # Arrange: Create task with comments
-        from tests.factories import CommentFactory
-        
-        task = await TaskFactory.create_task(
-            db_session=db_session,
-            owner=test_user_owner
-        )
-        
-        await CommentFactory.create_comment(
-            db_session=db_session,
-            task=task,
-            author=test_user_owner
+        # Act: Call the endpoint on a non-existent task
+        response = await getattr(client, method)(
+            "/api/v1/tasks/99999",
+            headers=auth_headers_owner,
+            **extra
         )
         
-        # Act: Delete the task
-        response = await client.delete(
-            f"/api/v1/tasks/{task.id}",
-            headers=auth_headers_owner
-        )
+        # Assert: Verify not found
+        assert response.status_code == 404
+
+
+# ============================================================================
+# Authentication
+# ============================================================================
+
+class TestTaskAuthentication:
+    """
+    Tests that the task endpoints require authentication.
+    
+    A single parametrized test covers the endpoints, so the 401 check is
+    written once and new endpoints only need a new parameter.
+    """
+    
+    @pytest.mark.parametrize(
+        "method, url, extra",
+        [
+            ("get", "/api/v1/tasks", {}),
+            ("post", "/api/v1/tasks", {"json": {"title": "Unauthorized Task"}}),
+            # Authentication is checked before the task is looked up, so
+            # the single-task endpoints need no existing task
+            ("get", "/api/v1/tasks/1", {}),
+            ("put", "/api/v1/tasks/1", {"json": {"title": "Unauthorized Title"}}),
+            ("delete", "/api/v1/tasks/1", {}),
+        ],
+    )
+    async def test_endpoint_requires_authentication(
+        self,
+        client_no_db: AsyncClient,
+        method: str,
+        url: str,
+        extra: dict
+    ):
+        """
+        Test that the endpoint requires authentication.
         
-        # Assert: Task and comments deleted
-        assert response.status_code == 204
+        Verifies:
+        - Unauthenticated requests are rejected with 401
+        """
+        # Act: Call the endpoint without authentication
+        response = await getattr(client_no_db, method)(url, **extra)
         
-        # Verify comments endpoint returns 404
-        comments_response = await client.get(
-            f"/api/v1/tasks/{task.id}/comments",
-            headers=auth_headers_owner
-        )
-        assert comments_response.status_code == 404
+        # Assert: Verify unauthorized response
+        assert response.status_code == 401
 
 
 # ============================================================================
@@ -758,11 +611,10 @@ class TestDeleteTask:
 class TestComplexTaskScenarios:
     """Test suite for complex multi-step task scenarios."""
     
-    @pytest.mark.asyncio
     async def test_task_lifecycle_complete_flow(
         self,
         client: AsyncClient,
-        auth_headers_owner: dict
+        auth_headers_owner: Headers
     ):
         """
         Test complete task lifecycle: create -> update -> complete -> delete.
@@ -805,14 +657,13 @@ class TestComplexTaskScenarios:
         )
         assert delete_response.status_code == 204
     
-    @pytest.mark.asyncio
     async def test_multiple_users_isolated_tasks(
         self,
         client: AsyncClient,
         test_user_owner: User,
         test_user_member: User,
-        auth_headers_owner: dict,
-        auth_headers_member: dict,
+        auth_headers_owner: Headers,
+        auth_headers_member: Headers,
         db_session
     ):
         """
@@ -841,7 +692,7 @@ class TestComplexTaskScenarios:
             headers=auth_headers_owner
         )
         assert owner_response.status_code == 200
-        assert len(owner_response.json()) == 5  # Owner sees all tasks
+        assert len(orjson.loads(owner_response.content)) == 5  # Owner sees all tasks
         
         # Act & Assert: Member sees only their 2 tasks
         member_response = await client.get(
@@ -849,6 +700,4 @@ class TestComplexTaskScenarios:
             headers=auth_headers_member
         )
         assert member_response.status_code == 200
-        assert len(member_response.json()) == 2  # Member sees only their tasks
-        assert member_response.status_code == 200
-        assert len(member_response.json()) == 2
+        assert len(orjson.loads(member_response.content)) == 2  # Member sees only their tasks